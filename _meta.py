@@ -0,0 +1,179 @@
+"""
+Project metadata: core paths, project name and version, plus the shared
+sys.path / appmanager import helpers.
+
+Kept separate from __main__.py so that config.py can import these without
+executing the entry point module. Everything here is resolved once.
+"""
+
+import sys
+from functools import cache
+from pathlib import Path
+
+# ==========================================================================
+# PROJECT CONSTANTS (Safe from user config.py modifications)
+# ==========================================================================
+
+# Core paths
+if getattr(sys, 'frozen', False):
+    # Running as executable - use executable's directory
+    PROJECT_ROOT = Path(sys.executable).parent
+    PROJECT_DIR = PROJECT_ROOT
+else:
+    # Running as script - use normal path resolution
+    PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+    PROJECT_DIR = Path(__file__).parent
+
+def ensure_project_on_syspath():
+    """Make PROJECT_ROOT importable (for appmanager) without re-inserting it."""
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+# Cached appmanager config module (False = import already attempted and failed)
+_APP_CONFIG = None
+
+def get_app_config():
+    """Import appmanager's config once and reuse it; None if unavailable."""
+    global _APP_CONFIG
+    if _APP_CONFIG is None:
+        try:
+            ensure_project_on_syspath()
+            from appmanager import config as app_config
+            _APP_CONFIG = app_config
+        except ImportError:
+            _APP_CONFIG = False
+    return _APP_CONFIG or None
+
+@cache
+def _get_project_name():
+    """Get project name from folder."""
+    if getattr(sys, 'frozen', False):
+        # Running as executable - use parent directory name (the actual project root)
+        return PROJECT_ROOT.parent.name
+    else:
+        # Running as script - use project root name
+        return PROJECT_ROOT.name
+
+# On-disk cache of the resolved version (script mode only)
+VERSION_CACHE_FILE = PROJECT_DIR / ".version.cache"
+VERSION_SOURCE_FILES = (
+    PROJECT_ROOT / "requirements" / "version.txt",  # Standard PySeed
+    PROJECT_ROOT / "version.txt",  # Root level
+    PROJECT_DIR / "requirements" / "version.txt",
+    PROJECT_DIR / "version.txt",  # Project level
+)
+# Same layout as the bundled project_config.json (paths relative to PROJECT_DIR)
+PROJECT_CONFIG_FILE = PROJECT_ROOT / "project_config.json"
+
+def _version_source_files():
+    """Get every file the version may be read from, including a configured path."""
+    source_files = list(VERSION_SOURCE_FILES)
+    try:
+        import json
+        config_data = json.loads(PROJECT_CONFIG_FILE.read_text())
+        if config_data.get('project_mode', 'PYSEED_PROJECT') == "EXTERNAL_REPO":
+            custom_path = config_data.get('project_paths', {}).get('version_txt')
+            if custom_path:
+                source_files.append(PROJECT_DIR / custom_path)
+        # A changed config may point at a different version.txt
+        source_files.append(PROJECT_CONFIG_FILE)
+    except (OSError, ValueError, AttributeError):
+        pass
+    return source_files
+
+def _read_version_cache():
+    """Return the cached version if it is at least as new as every version source."""
+    try:
+        cache_mtime = VERSION_CACHE_FILE.stat().st_mtime
+    except OSError:
+        return None
+    source_mtimes = []
+    for source_file in _version_source_files():
+        try:
+            source_mtimes.append(source_file.stat().st_mtime)
+        except OSError:
+            continue
+    # No version.txt to validate against - don't trust the cache
+    if not source_mtimes or max(source_mtimes) > cache_mtime:
+        return None
+    try:
+        return VERSION_CACHE_FILE.read_text().strip() or None
+    except OSError:
+        return None
+
+def _write_version_cache(version):
+    """Persist the resolved version for the next start."""
+    try:
+        VERSION_CACHE_FILE.write_text(version)
+    except OSError:
+        pass
+
+@cache
+def _get_version():
+    """Get version from appmanager config with dynamic path support."""
+    if getattr(sys, 'frozen', False):
+        # Running as executable - check PyInstaller bundle first
+        try:
+            bundle_dir = Path(sys._MEIPASS)
+            possible_bundled_paths = []
+            
+            # Try to read project config to get dynamic paths
+            try:
+                import json
+                config_file = bundle_dir / "project_config.json"
+                if config_file.exists():
+                    with open(config_file, 'r') as f:
+                        config_data = json.load(f)
+                    project_mode = config_data.get('project_mode', 'PYSEED_PROJECT')
+                    
+                    if project_mode == "EXTERNAL_REPO":
+                        custom_path = config_data.get('project_paths', {}).get('version_txt')
+                        if custom_path:
+                            possible_bundled_paths.append(bundle_dir / "project" / custom_path)
+                    
+                    # Always try PYSEED_PROJECT structure as fallback
+                    possible_bundled_paths.append(bundle_dir / "project" / "requirements" / "version.txt")
+                else:
+                    # No config found, assume PYSEED_PROJECT
+                    possible_bundled_paths.append(bundle_dir / "project" / "requirements" / "version.txt")
+            except:
+                # Config reading failed, use default
+                possible_bundled_paths.append(bundle_dir / "project" / "requirements" / "version.txt")
+            
+            for bundled_version in possible_bundled_paths:
+                if bundled_version.exists():
+                    return bundled_version.read_text().strip()
+        except:
+            pass
+        
+        # Fallback to external file locations
+        possible_paths = [
+            PROJECT_ROOT.parent / "requirements" / "version.txt",  # Standard PySeed
+            PROJECT_ROOT.parent / "version.txt",  # Root level
+            PROJECT_ROOT / "version.txt"  # Same directory as executable
+        ]
+        for version_file in possible_paths:
+            if version_file.exists():
+                try:
+                    return version_file.read_text().strip()
+                except:
+                    continue
+        return "1.0.0"  # Fallback
+    else:
+        # Running as script - use the cached version if version.txt is unchanged
+        cached_version = _read_version_cache()
+        if cached_version:
+            return cached_version
+        
+        # Otherwise use appmanager's dynamic version detection
+        try:
+            ensure_project_on_syspath()
+            from appmanager import utils
+            version = utils.get_version()
+            _write_version_cache(version)
+            return version
+        except ImportError:
+            return "1.0.0"  # Fallback
+
+PROJECT_NAME = _get_project_name()
+VERSION = _get_version()
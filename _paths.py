@@ -0,0 +1,25 @@
+"""
+Per-user application data paths (fallback when appmanager is unavailable).
+"""
+
+import os
+import platform
+from functools import cache
+from pathlib import Path
+
+
+@cache
+def app_data_dir(project_name: str) -> Path:
+    """Get the project's application data directory, mirroring appmanager."""
+    system = platform.system()
+    if system == "Windows":
+        app_data = os.environ.get("LOCALAPPDATA")
+        if not app_data:
+            raise RuntimeError("LOCALAPPDATA environment variable not found.")
+        return Path(app_data) / project_name
+    elif system == "Linux":
+        xdg_data_home = os.environ.get("XDG_DATA_HOME")
+        base_path = Path(xdg_data_home) if xdg_data_home else Path.home() / ".local" / "share"
+        return base_path / project_name
+    else:
+        return Path.home() / f".{project_name}"
@@ -2,41 +2,67 @@
 Chrome WebDriver management for the project.
 """
 
-import sys
 import time
 from contextlib import contextmanager
-from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
 
+from ._meta import get_app_config
+from ._paths import app_data_dir
 from .config import Config
 
 
+# Chrome switches to suppress (shared, never mutated)
+_EXCLUDE_SWITCHES = ("enable-automation",)
+
+
 class ChromeDriverManager:
     """Manages Chrome WebDriver setup and configuration."""
     
+    # Resolved once per process and shared by all instances
+    _platform_cache = None
+    _chrome_paths_cache = None
+    
+    # Chrome arguments that are the same for every launch
+    _STATIC_ARGS = (
+        "--start-maximized",
+        "--disable-infobars",
+        "--no-first-run",
+        "--disable-default-apps",
+    )
+    
     def __init__(self):
-        self.config = Config()
+        self.config = Config
         self.platform = self._get_platform()
+        self._is_linux = self.platform == "Linux"
         
-    def _get_platform(self):
+    @classmethod
+    def _get_platform(cls):
         """Get the current platform."""
-        try:
-            sys.path.insert(0, str(self.config.PROJECT_ROOT))
-            from appmanager import config as app_config
-            return app_config.get_platform()
-        except ImportError:
+        if cls._platform_cache is not None:
+            return cls._platform_cache
+        
+        app_config = get_app_config()
+        if app_config is not None:
+            cls._platform_cache = app_config.get_platform()
+        else:
             import platform
-            return platform.system()
+            cls._platform_cache = platform.system()
+        return cls._platform_cache
     
-    def _get_chrome_paths(self):
+    @classmethod
+    def _get_chrome_paths(cls):
         """Get Chrome binary and driver paths."""
-        try:
-            sys.path.insert(0, str(self.config.PROJECT_ROOT))
-            from appmanager import config as app_config
-            
-            if self.platform == "Windows":
+        if cls._chrome_paths_cache is not None:
+            return cls._chrome_paths_cache
+        
+        cls._chrome_paths_cache = cls._resolve_chrome_paths(cls._get_platform())
+        return cls._chrome_paths_cache
+    
+    @staticmethod
+    def _resolve_chrome_paths(platform):
+        """Compute Chrome binary and driver paths for the given platform."""
+        app_config = get_app_config()
+        if app_config is not None:
+            if platform == "Windows":
                 chrome_binary = app_config.CHROME_FOR_TESTING_DIR / "chrome-win64/chrome.exe"
                 driver_path = app_config.CHROMEDRIVER_PATH
             else:
@@ -44,41 +70,35 @@ class ChromeDriverManager:
                 driver_path = app_config.CHROMEDRIVER_PATH
                 
             return chrome_binary, driver_path
-        except ImportError:
-            # Fallback for built executables - use same logic as appmanager
-            import os
-            
-            if self.platform == "Windows":
-                app_data = os.environ.get("LOCALAPPDATA")
-                if not app_data:
-                    raise RuntimeError("LOCALAPPDATA environment variable not found.")
-                base_path = Path(app_data)
-            elif self.platform == "Linux":
-                xdg_data_home = os.environ.get("XDG_DATA_HOME")
-                base_path = Path(xdg_data_home) if xdg_data_home else Path.home() / ".local" / "share"
-            else:
-                base_path = Path.home()
-                project_name = self.config.PROJECT_ROOT.name.lower()
-                chrome_dir = base_path / f".{project_name}" / "ChromeForTesting"
-                if self.platform == "Windows":
-                    return chrome_dir / "chrome-win64/chrome.exe", chrome_dir / "chromedriver-win64/chromedriver.exe"
-                else:
-                    return chrome_dir / "chrome-linux64/chrome", chrome_dir / "chromedriver-linux64/chromedriver"
-            
-            project_name = self.config.PROJECT_ROOT.name.lower()
-            chrome_dir = base_path / project_name / "ChromeForTesting"
+        
+        # Fallback for built executables - use same logic as appmanager
+        chrome_dir = app_data_dir(Config.PROJECT_ROOT.name.lower()) / "ChromeForTesting"
+        
+        if platform == "Windows":
+            chrome_binary = chrome_dir / "chrome-win64/chrome.exe"
+            driver_path = chrome_dir / "chromedriver-win64/chromedriver.exe"
+        else:
+            chrome_binary = chrome_dir / "chrome-linux64/chrome"
+            driver_path = chrome_dir / "chromedriver-linux64/chromedriver"
             
-            if self.platform == "Windows":
-                chrome_binary = chrome_dir / "chrome-win64/chrome.exe"
-                driver_path = chrome_dir / "chromedriver-win64/chromedriver.exe"
-            else:
-                chrome_binary = chrome_dir / "chrome-linux64/chrome"
-                driver_path = chrome_dir / "chromedriver-linux64/chromedriver"
-                
-            return chrome_binary, driver_path
+        return chrome_binary, driver_path
     
-    def create_driver(self, profile_name=None, detach=False):
-        """Create and configure Chrome WebDriver."""
+    def create_driver(self, profile_name=None, detach=False, fresh=False):
+        """Create and configure Chrome WebDriver.
+        
+        The profile directory is reused across runs so Chrome keeps its disk
+        cache and cookies; pass fresh=True to start from an empty profile.
+        Chrome allows only one browser per profile directory, so if the
+        profile is still held (e.g. by a keep_open/detach session or a
+        concurrent run) the launch is retried once with a fresh profile.
+        """
+        # Selenium is imported here rather than at module level so that
+        # startup does not pay for it until Chrome is actually launched
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        
         if profile_name is None:
             profile_name = self.config.DEFAULT_PROFILE_NAME
             
@@ -89,41 +109,46 @@ class ChromeDriverManager:
         if not driver_path.exists():
             raise FileNotFoundError(f"ChromeDriver not found at: {driver_path}")
         
-        # Create unique profile path
-        timestamp = int(time.time())
-        profile_path = self.config.get_chrome_profile_path() / f"{profile_name}_{timestamp}"
+        # Reuse a stable profile path unless a fresh profile was requested
+        if fresh:
+            profile_name = f"{profile_name}_{int(time.time())}"
+        profile_path = self.config.get_chrome_profile_path() / profile_name
         
         # Configure Chrome options
         options = Options()
         options.binary_location = str(chrome_binary)
         options.add_argument(f"--user-data-dir={profile_path}")
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--no-first-run")
-        options.add_argument("--disable-default-apps")
+        for arg in self._STATIC_ARGS:
+            options.add_argument(arg)
         
         if detach:
             options.add_experimental_option("detach", True)
         
-        if self.platform == "Linux":
+        if self._is_linux:
             options.add_argument("--no-sandbox")
             
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("excludeSwitches", _EXCLUDE_SWITCHES)
         options.add_experimental_option("useAutomationExtension", False)
         
         # Create service
         service = ChromeService(executable_path=str(driver_path))
         
-        return webdriver.Chrome(service=service, options=options)
+        try:
+            return webdriver.Chrome(service=service, options=options)
+        except SessionNotCreatedException as e:
+            if fresh or "user data directory is already in use" not in str(e):
+                raise
+            print(f"[WARNING] Chrome profile '{profile_name}' is in use, launching with a fresh profile.")
+            return self.create_driver(profile_name, detach=detach, fresh=True)
     
     @contextmanager
-    def managed_driver(self, profile_name=None, keep_open=False):
+    def managed_driver(self, profile_name=None, keep_open=False, fresh=False):
         """Context manager for Chrome WebDriver."""
         driver = None
         self._keep_open = keep_open
         try:
             print(f"[INFO] Launching Chrome with profile: {profile_name or self.config.DEFAULT_PROFILE_NAME}...")
-            driver = self.create_driver(profile_name)
+            driver = self.create_driver(profile_name, fresh=fresh)
             yield driver
         except FileNotFoundError as e:
             print(f"\n[ERROR] Required file not found: {e}")
@@ -2,26 +2,23 @@
 Configuration settings for the main project.
 """
 
-import os
-from pathlib import Path
+from ._meta import get_app_config
+from ._paths import app_data_dir
 
 
 class Config:
-    """Configuration class for project settings."""
+    """Configuration class for project settings.
+    
+    All settings are class-level, so components use the class itself
+    (self.config = Config) instead of creating instances.
+    """
     
     # ==========================================================================
     # CORE PATHS & PROJECT INFO
     # ==========================================================================
     
-    # Import constants from __main__.py (safe from user modifications)
-    try:
-        from project.__main__ import PROJECT_ROOT, PROJECT_DIR, PROJECT_NAME, VERSION
-    except ImportError:
-        # Fallback if __main__.py is not available
-        PROJECT_ROOT = Path(__file__).parent.parent.resolve()
-        PROJECT_DIR = Path(__file__).parent
-        PROJECT_NAME = PROJECT_ROOT.name
-        VERSION = "1.0.0"
+    # Import constants from _meta.py (safe from user modifications)
+    from ._meta import PROJECT_ROOT, PROJECT_DIR, PROJECT_NAME, VERSION
     
     # ==========================================================================
     # CHROME CONFIGURATION
@@ -32,32 +29,13 @@ class Config:
     @classmethod
     def get_chrome_profile_path(cls):
         """Get the Chrome profile path from appmanager config."""
-        try:
-            import sys
-            sys.path.insert(0, str(cls.PROJECT_ROOT))
-            from appmanager import config as app_config
+        app_config = get_app_config()
+        if app_config is not None:
             return app_config.APP_DATA_DIR / "ChromeProfiles" / f"{cls.DEFAULT_PROFILE_NAME}"
-        except ImportError:
-            # Fallback for built executables - use same logic as appmanager
-            import os
-            import platform
-            
-            system = platform.system()
-            if system == "Windows":
-                app_data = os.environ.get("LOCALAPPDATA")
-                if not app_data:
-                    raise RuntimeError("LOCALAPPDATA environment variable not found.")
-                base_path = Path(app_data)
-            elif system == "Linux":
-                xdg_data_home = os.environ.get("XDG_DATA_HOME")
-                base_path = Path(xdg_data_home) if xdg_data_home else Path.home() / ".local" / "share"
-            else:
-                base_path = Path.home()
-                project_name = cls.PROJECT_ROOT.name.lower()
-                return base_path / f".{project_name}" / "ChromeProfiles" / f"{cls.DEFAULT_PROFILE_NAME}"
-            
-            project_name = cls.PROJECT_ROOT.name.lower()
-            return base_path / project_name / "ChromeProfiles" / f"{cls.DEFAULT_PROFILE_NAME}"
+        
+        # Fallback for built executables - use same logic as appmanager
+        project_name = cls.PROJECT_ROOT.name.lower()
+        return app_data_dir(project_name) / "ChromeProfiles" / f"{cls.DEFAULT_PROFILE_NAME}"
     
     # ==========================================================================
     # APPLICATION SETTINGS
@@ -69,6 +47,9 @@ class Config:
     # Search settings
     DEFAULT_SEARCH_TERM = "What's New"
     
+    # Pause for an extra prompt before the "close Chrome" prompt
+    INTERACTIVE_PAUSE = False
+    
     # Timeouts (in seconds)
     PAGE_LOAD_TIMEOUT = 10
     ELEMENT_WAIT_TIMEOUT = 10
\ No newline at end of file
@@ -8,11 +8,14 @@ from .utils import FileHandler
 from .config import Config
 
 
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
 class MainApplication:
     """Main application class that orchestrates all components."""
     
     def __init__(self):
-        self.config = Config()
+        self.config = Config
         self.chrome_manager = ChromeDriverManager()
         self.file_handler = FileHandler()
         
@@ -40,8 +43,9 @@ class MainApplication:
                 if video_titles:
                     self._save_results(video_titles)
                 
-                # Wait for user interaction
-                input("\n[INFO] Browse the results and press Enter when done...")
+                # Optional step-through pause before the closing prompt
+                if self.config.INTERACTIVE_PAUSE:
+                    input("\n[INFO] Browse the results and press Enter when done...")
                 
                 # Wait for user to finish browsing
                 input("\n[INFO] Press Enter to close Chrome and exit...")
@@ -55,26 +59,32 @@ class MainApplication:
     def _save_results(self, video_titles):
         """Save video titles to a file."""
         try:
+            # Both files share one directory and one timestamp
+            results_dir = self.config.PROJECT_DIR / "results"
+            search_term = getattr(self, '_last_search_term', self.config.DEFAULT_SEARCH_TERM)
+            timestamp = self._get_timestamp()
+            
             # Save as JSON
             data = {
-                "search_term": getattr(self, '_last_search_term', self.config.DEFAULT_SEARCH_TERM),
-                "timestamp": self._get_timestamp(),
+                "search_term": search_term,
+                "timestamp": timestamp,
                 "results": video_titles
             }
             
-            json_file = self.config.PROJECT_DIR / "results" / "youtube_results.json"
+            json_file = results_dir / "youtube_results.json"
             if self.file_handler.write_json(json_file, data):
                 print(f"[INFO] Results saved to: {json_file}")
             
             # Save as text file for easy reading
-            text_content = f"YouTube Search Results\n"
-            text_content += f"Search Term: {getattr(self, '_last_search_term', self.config.DEFAULT_SEARCH_TERM)}\n"
-            text_content += f"Timestamp: {self._get_timestamp()}\n\n"
-            
-            for i, title in enumerate(video_titles, 1):
-                text_content += f"{i}. {title}\n"
+            parts = [
+                "YouTube Search Results\n",
+                f"Search Term: {search_term}\n",
+                f"Timestamp: {timestamp}\n\n",
+            ]
+            parts.extend(f"{i}. {title}\n" for i, title in enumerate(video_titles, 1))
+            text_content = "".join(parts)
             
-            text_file = self.config.PROJECT_DIR / "results" / "youtube_results.txt"
+            text_file = results_dir / "youtube_results.txt"
             if self.file_handler.write_text(text_file, text_content):
                 print(f"[INFO] Results also saved to: {text_file}")
                 
@@ -83,8 +93,9 @@ class MainApplication:
     
     def _get_timestamp(self):
         """Get current timestamp string."""
+        # Imported lazily; after the first call this is just a sys.modules lookup
         from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return datetime.now().strftime(TIMESTAMP_FORMAT)
     
     def run(self):
         """Main entry point for the application."""
@@ -2,15 +2,42 @@
 File read/write operations for the project.
 """
 
-import json
-import csv
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+
+
+# orjson is an optional, faster JSON backend. Its output differs slightly from
+# the json module: floats use the shortest form (1e-7 rather than 1e-07), NaN and
+# Infinity are written as null, and integers beyond 64 bits are read as floats.
+@cache
+def _get_orjson():
+    """Import orjson on first use; None if it is not installed."""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+
+def _dumps_orjson(data: Any) -> Optional[bytes]:
+    """Serialize data with orjson (2-space indent); None to fall back to json."""
+    orjson = _get_orjson()
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    except orjson.JSONEncodeError:
+        # e.g. ints beyond 64 bits or non-str keys, which json handles
+        return None
 
 
 class FileHandler:
     """Handles file read/write operations."""
     
+    # Directories already created by this process (shared by all instances)
+    _ensured_dirs: Set[Path] = set()
+    
     def __init__(self, base_path: Optional[Path] = None):
         self.base_path = base_path or Path.cwd()
     
@@ -30,7 +57,7 @@ class FileHandler:
         """Write text content to file."""
         full_path = self._resolve_path(file_path)
         try:
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent(full_path)
             full_path.write_text(content, encoding='utf-8')
             print(f"[INFO] File written: {full_path}")
             return True
@@ -40,8 +67,18 @@ class FileHandler:
     
     def read_json(self, file_path: Path) -> Dict[str, Any]:
         """Read JSON file content."""
+        import json
+        
         full_path = self._resolve_path(file_path)
         try:
+            orjson = _get_orjson()
+            if orjson is not None:
+                content = full_path.read_bytes()
+                try:
+                    return orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # orjson is stricter (e.g. NaN literals) - let json decide
+                    return json.loads(content)
             with open(full_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except FileNotFoundError:
@@ -56,11 +93,17 @@ class FileHandler:
     
     def write_json(self, file_path: Path, data: Dict[str, Any], indent: int = 2) -> bool:
         """Write data to JSON file."""
+        import json
+        
         full_path = self._resolve_path(file_path)
         try:
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(full_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
+            self._ensure_parent(full_path)
+            content = _dumps_orjson(data) if indent == 2 else None
+            if content is not None:
+                full_path.write_bytes(content)
+            else:
+                with open(full_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=indent, ensure_ascii=False)
             print(f"[INFO] JSON file written: {full_path}")
             return True
         except Exception as e:
@@ -69,6 +112,8 @@ class FileHandler:
     
     def read_csv(self, file_path: Path) -> List[Dict[str, str]]:
         """Read CSV file content."""
+        import csv
+        
         full_path = self._resolve_path(file_path)
         try:
             with open(full_path, 'r', encoding='utf-8') as f:
@@ -85,10 +130,12 @@ class FileHandler:
         if not data:
             print("[WARNING] No data to write to CSV")
             return False
-            
+        
+        import csv
+        
         full_path = self._resolve_path(file_path)
         try:
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent(full_path)
             fieldnames = fieldnames or list(data[0].keys())
             
             with open(full_path, 'w', newline='', encoding='utf-8') as f:
@@ -111,11 +158,19 @@ class FileHandler:
         full_path = self._resolve_path(dir_path)
         try:
             full_path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(full_path)
             return True
         except Exception as e:
             print(f"[ERROR] Failed to create directory {full_path}: {e}")
             return False
     
+    def _ensure_parent(self, path: Path):
+        """Create the parent directory of path unless already done this process."""
+        parent = path.parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
+    
     def _resolve_path(self, file_path: Path) -> Path:
         """Resolve path relative to base path."""
         if file_path.is_absolute():
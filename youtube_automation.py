@@ -1,42 +1,68 @@
 """
 YouTube automation functionality.
+
+Selenium imports are kept inside the methods that use them so that importing
+this module does not load Selenium before a browser is actually driven.
 """
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from functools import cached_property
 
 from .config import Config
 
 
+# Element locators, shared across calls. The strategy strings are the values of
+# selenium's By.TAG_NAME / By.NAME / By.ID / By.CSS_SELECTOR, spelled out so that
+# importing this module does not import Selenium.
+_LOC_BODY = ("tag name", "body")
+_LOC_SEARCH = ("name", "search_query")
+_LOC_CONTENTS = ("id", "contents")
+_LOC_VIDEO_TITLES = ("css selector", "a#video-title")
+
+# Returns the non-empty titles of the first arguments[0] search results
+_JS_GET_VIDEO_TITLES = (
+    "return Array.from(document.querySelectorAll('a#video-title'))"
+    ".slice(0, arguments[0]).map(a => a.title).filter(Boolean);"
+)
+
+
 class YouTubeAutomation:
     """Handles YouTube automation tasks."""
     
     def __init__(self, driver):
         self.driver = driver
-        self.config = Config()
-        self.wait = WebDriverWait(driver, self.config.ELEMENT_WAIT_TIMEOUT)
+        self.config = Config
+    
+    @cached_property
+    def wait(self):
+        """WebDriverWait for this driver, created on first use."""
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        return WebDriverWait(self.driver, self.config.ELEMENT_WAIT_TIMEOUT)
     
     def navigate_to_youtube(self):
         """Navigate to YouTube homepage."""
+        from selenium.webdriver.support import expected_conditions as EC
+        
         print("[INFO] Navigating to YouTube...")
         self.driver.get(self.config.YOUTUBE_URL)
         
         # Wait for page to load
         self.wait.until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
+            EC.presence_of_element_located(_LOC_BODY)
         )
         print("[SUCCESS] YouTube loaded successfully")
     
     def search(self, search_term):
         """Search for content on YouTube."""
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
             print(f"[INFO] Searching for: {search_term}")
             
             # Find and interact with search box
             search_box = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "search_query"))
+                EC.presence_of_element_located(_LOC_SEARCH)
             )
             
             search_box.clear()
@@ -45,7 +71,7 @@ class YouTubeAutomation:
             
             # Wait for results to load
             self.wait.until(
-                EC.presence_of_element_located((By.ID, "contents"))
+                EC.presence_of_element_located(_LOC_CONTENTS)
             )
             
             print(f"[SUCCESS] Search completed for: {search_term}")
@@ -57,17 +83,16 @@ class YouTubeAutomation:
     
     def get_video_titles(self, max_results=10):
         """Get video titles from search results."""
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            # Wait for video elements to load
-            video_elements = self.wait.until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a#video-title"))
+            # Wait for the first video element; the titles are read in bulk below
+            self.wait.until(
+                EC.presence_of_element_located(_LOC_VIDEO_TITLES)
             )
             
-            titles = []
-            for element in video_elements[:max_results]:
-                title = element.get_attribute("title")
-                if title:
-                    titles.append(title)
+            # Read all titles in one browser round trip instead of one per element
+            titles = self.driver.execute_script(_JS_GET_VIDEO_TITLES, max_results)
             
             print(f"[INFO] Found {len(titles)} video titles")
             return titles